@@ -39,8 +39,11 @@ python push_storymap_r4_to_miro.py --board $MIRO_BOARD_ID --csv storymap_r4.csv
 
 Dépendances
 -----------
-- Python 3.9+
-- pip install requests python-slugify pandas (pandas uniquement si CSV utilisé)
+- Python 3.11+
+- pip install 'httpx[http2]' numpy python-slugify (le CSV est lu avec le module standard csv)
+- optionnel : pip install orjson (sérialisation JSON plus rapide des payloads)
+- optionnel : pip install uvloop (boucle d'événements libuv, --backend uvloop)
+- optionnel : pip install numba (placement compilé pour les très gros CSV, --fast)
 
 Notes d'implémentation
 ----------------------
@@ -50,27 +53,48 @@ Notes d'implémentation
   l'option --dry-run pour prévisualiser ou supprimer manuellement.
 - Le placement est géré par une grille : chaque THÈME = colonne, chaque ACTIVITÉ = ligne.
 - Les couleurs de sticky sont mappées par équipe.
+- Le débit est régulé par MiroRateLimiter (fenêtre glissante d'une seconde,
+  pauses sur Retry-After / X-RateLimit-*) plutôt que par des sleep fixes.
 
 Références API
 --------------
 - POST /v2/boards/{board_id}/frames
-- POST /v2/boards/{board_id}/sticky_notes
+- POST /v2/boards/{board_id}/items/bulk (stickies par paquets de 20)
 - POST /v2/boards/{board_id}/shapes (utilisé pour titres / swimlanes)
 - Doc Miro Board API v2 (schéma simplifié ici pour rester robuste)
 """
 
+import io
 import os
+import sys
 import csv
 import json
-import time
 import math
+import mmap
+import time
+import random
+import asyncio
 import argparse
-from typing import Dict, List, Optional, Tuple
+import functools
+import collections
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    raise SystemExit("Veuillez installer httpx: pip install 'httpx[http2]'")
 
 try:
-    import requests
+    import numpy as np
 except ImportError:
-    raise SystemExit("Veuillez installer requests: pip install requests")
+    raise SystemExit("Veuillez installer numpy: pip install numpy")
+
+try:
+    import orjson
+except ImportError:  # optionnel : sérialisation plus rapide si disponible
+    orjson = None
 
 # --- Configuration visuelle et mapping projet IT CALF (Release 4) ---
 TEAM_COLOR = {
@@ -203,6 +227,81 @@ DEFAULT_MODEL = {
 
 # --- Helpers HTTP ---
 
+API_BASE = "https://api.miro.com/v2"
+HTTP_TIMEOUT = 10
+MAX_CONCURRENCY = 16  # requêtes simultanées max vers api.miro.com
+BULK_MAX_ITEMS = 20  # limite Miro par appel à /items/bulk
+MAX_REQUESTS_PER_SEC = 25  # ~100k crédits/min côté Miro, 50 crédits par appel
+MAX_RETRIES = 5  # tentatives supplémentaires sur RETRY_STATUSES
+RETRY_STATUSES = (429, 503)  # limitation de débit / indisponibilité passagère
+
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+CONNECT_RETRIES = 3  # erreurs de connexion uniquement (les statuts sont gérés dans _apost)
+
+
+class MiroRateLimiter:
+    """Fenêtre glissante d'une seconde, ajustée par les en-têtes de Miro (`async with`)."""
+
+    def __init__(self, max_per_sec: int = MAX_REQUESTS_PER_SEC):
+        self.max_per_sec = max_per_sec
+        self._stamps = collections.deque()
+        self._paused_until = 0.0
+
+    def _delay(self) -> float:
+        now = time.monotonic()
+        while self._stamps and self._stamps[0] <= now - 1:
+            self._stamps.popleft()
+        delay = self._paused_until - now
+        if len(self._stamps) >= self.max_per_sec:
+            delay = max(delay, self._stamps[0] + 1 - now)
+        return delay
+
+    def observe(self, headers) -> None:
+        """Suspend les envois si Miro renvoie Retry-After ou un quota épuisé."""
+        now = time.monotonic()
+        retry_after = _retry_after(headers)
+        if retry_after is not None:
+            self._paused_until = max(self._paused_until, now + retry_after)
+        elif headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+            wait = float(headers["X-RateLimit-Reset"]) - time.time()
+            self._paused_until = max(self._paused_until, now + wait)
+
+    async def __aenter__(self):
+        while (delay := self._delay()) > 0:
+            await asyncio.sleep(delay)
+        self._stamps.append(time.monotonic())
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+LIMITER = MiroRateLimiter()
+
+
+def _retry_after(headers) -> Optional[float]:
+    """Retry-After en secondes ; None si absent ou au format date HTTP."""
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _retry_delay(headers, attempt: int) -> float:
+    """Délai avant nouvelle tentative : Retry-After sinon 2**attempt, avec jitter."""
+    delay = _retry_after(headers)
+    if delay is None:
+        delay = 2 ** attempt
+    return delay * (1 + random.random() * 0.2)
+
+
+def _dumps(payload) -> bytes:
+    """Corps JSON encodé en UTF-8 (orjson si installé)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
 def _auth_headers(token: str) -> Dict[str, str]:
     return {
         "Authorization": f"Bearer {token}",
@@ -210,46 +309,100 @@ def _auth_headers(token: str) -> Dict[str, str]:
     }
 
 
-def _post(url: str, token: str, payload: Dict) -> Dict:
-    resp = requests.post(url, headers=_auth_headers(token), data=json.dumps(payload))
-    if resp.status_code >= 400:
-        raise RuntimeError(f"POST {url} failed: {resp.status_code} {resp.text}")
-    return resp.json()
+def open_async_session(token: str) -> httpx.AsyncClient:
+    """Client HTTP/2 asynchrone authentifié : les requêtes concurrentes sont
+    multiplexées sur une même connexion TLS."""
+    return httpx.AsyncClient(
+        headers=_auth_headers(token),
+        timeout=HTTP_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS, retries=CONNECT_RETRIES),
+    )
+
+
+async def _apost(session: httpx.AsyncClient, url: str, payload: Dict) -> Dict:
+    for attempt in range(MAX_RETRIES + 1):
+        async with LIMITER:
+            try:
+                resp = await session.post(url, content=_dumps(payload))
+            except httpx.HTTPError as exc:
+                # connexion / timeout : même forme d'erreur que les statuts HTTP
+                raise RuntimeError(f"POST {url} failed: {exc!r}") from exc
+        LIMITER.observe(resp.headers)
+        if resp.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            await asyncio.sleep(_retry_delay(resp.headers, attempt))
+            continue
+        if resp.status_code >= 400:
+            raise RuntimeError(f"POST {url} failed: {resp.status_code} {resp.text}")
+        return resp.json()
+
+
+async def _bounded(sem: asyncio.Semaphore, func, *args, **kwargs):
+    # la coroutine n'est créée qu'une fois le sémaphore obtenu : une tâche
+    # annulée avant (TaskGroup en échec) ne laisse pas de coroutine orpheline
+    async with sem:
+        return await func(*args, **kwargs)
 
 
 # --- Miro primitives ---
 
-def create_frame(board_id: str, token: str, title: str, x: float, y: float, w: int = FRAME_W, h: int = FRAME_H) -> str:
-    url = f"https://api.miro.com/v2/boards/{board_id}/frames"
+def _sticky_payload(text: str, x: float, y: float, style: Dict) -> Dict:
+    return {
+        "data": {"content": text},
+        "style": style,
+        "position": {"x": x, "y": y},
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _style_for(team: str, status: str) -> Tuple[Dict, str]:
+    """Style sticky + emoji de statut, partagés par toutes les stories (team, status) identiques.
+
+    Le dict renvoyé est mis en cache : ne pas le modifier.
+    """
+    style = {"fillColor": TEAM_COLOR.get(team, "light_yellow"), "textAlign": "left"}
+    return style, STATUS_EMOJI.get(status, "⬜️")
+
+
+@functools.lru_cache(maxsize=None)
+def _suffix(team: str, sprint: str) -> str:
+    """Ligne « [équipe] [sprint] » des stickies, construite une fois par couple."""
+    return f"\n[{team}] [{sprint}]"
+
+
+async def create_frame_async(board_id: str, session: httpx.AsyncClient, title: str, x: float, y: float) -> str:
+    url = f"{API_BASE}/boards/{board_id}/frames"
     payload = {
         "data": {"title": title},
         "position": {"x": x, "y": y},
-        
     }
-    out = _post(url, token, payload)
+    out = await _apost(session, url, payload)
     return out.get("id")
 
 
-def create_shape(board_id: str, token: str, text: str, x: float, y: float, w: int, h: int, shape: str = "rectangle") -> str:
-    url = f"https://api.miro.com/v2/boards/{board_id}/shapes"
+async def create_shape_async(board_id: str, session: httpx.AsyncClient, text: str, x: float, y: float, shape: str = "rectangle") -> str:
+    url = f"{API_BASE}/boards/{board_id}/shapes"
     payload = {
         "data": {"content": text, "shape": shape},
         "position": {"x": x, "y": y},
         "style": {"fontSize": 28},
     }
-    out = _post(url, token, payload)
+    out = await _apost(session, url, payload)
     return out.get("id")
 
 
-def create_sticky(board_id: str, token: str, text: str, x: float, y: float, color: str = "light_yellow", w: int = STICKY_W, h: int = STICKY_H) -> str:
-    url = f"https://api.miro.com/v2/boards/{board_id}/sticky_notes"
-    payload = {
-        "data": {"content": text},
-        "style": {"fillColor": color, "textAlign": "left"},
-        "position": {"x": x, "y": y},
-    }
-    out = _post(url, token, payload)
-    return out.get("id")
+async def create_items_bulk(board_id: str, session: httpx.AsyncClient, items: List[Dict], sem: asyncio.Semaphore) -> List[str]:
+    """Crée les items par paquets de BULK_MAX_ITEMS ; renvoie les ids dans l'ordre de `items`.
+
+    Chaque paquet prend une place de `sem`, comme les autres appels.
+    """
+    url = f"{API_BASE}/boards/{board_id}/items/bulk"
+    chunks = [items[i:i + BULK_MAX_ITEMS] for i in range(0, len(items), BULK_MAX_ITEMS)]
+    outs = await asyncio.gather(*(_bounded(sem, _apost, session, url, chunk) for chunk in chunks))
+    ids = []
+    for out in outs:
+        created = out.get("data", []) if isinstance(out, dict) else out
+        ids.extend(item.get("id") for item in created)
+    return ids
 
 
 # --- Placement logique ---
@@ -268,115 +421,365 @@ def lane_title_y(frame_y: float, lane_idx: int) -> float:
     return frame_y - FRAME_H / 2 + TITLE_HEIGHT + lane_idx * LANE_HEIGHT + 30
 
 
-def sticky_grid_positions(start_x: float, start_y: float, columns: int, count: int) -> List[Tuple[float, float]]:
-    positions = []
-    for i in range(count):
-        row = i // columns
-        col = i % columns
-        x = start_x + col * (STICKY_W + STICKY_GAP_X)
-        y = start_y + row * (STICKY_H + STICKY_GAP_Y)
-        positions.append((x, y))
-    return positions
+def sticky_grid_positions(start_x: float, start_y: float, columns: int, count: int) -> np.ndarray:
+    """Positions (x, y) des `count` stickies, remplies ligne par ligne : tableau (count, 2)."""
+    rows, cols = np.divmod(np.arange(count), columns)
+    xs = start_x + cols * (STICKY_W + STICKY_GAP_X)
+    ys = start_y + rows * (STICKY_H + STICKY_GAP_Y)
+    return np.stack((xs, ys), axis=1)
+
+
+def enable_fast_geometry() -> None:
+    """Remplace les fonctions de placement par leur version compilée Numba
+    (--fast). Le code natif est mis en cache sur disque entre deux runs."""
+    try:
+        from numba import njit
+    except ImportError:
+        raise SystemExit("Veuillez installer numba: pip install numba")
+
+    global compute_frame_origin, lane_y, lane_title_y, sticky_grid_positions
+    compute_frame_origin = njit(cache=True)(compute_frame_origin)
+    lane_y = njit(cache=True)(lane_y)
+    lane_title_y = njit(cache=True)(lane_title_y)
+    sticky_grid_positions = njit(cache=True)(sticky_grid_positions)
 
 
 # --- Chargement CSV optionnel ---
 
-def load_from_csv(path: str) -> Dict:
+def _parse_row(row: Dict[str, str]) -> Tuple[str, str, Dict]:
+    theme = row.get("Theme", "Inconnu").strip()
+    activity = row.get("Activity", "Général").strip()
+    story = row.get("Story", "").strip()
+    sprint = row.get("Sprint", "S1").strip()
+    team = row.get("Team", "MO").strip()
+    status = row.get("Status", "Backlog").strip()
+    notes = row.get("Notes", "").strip()
+
+    title = story if not notes else f"{story}\n\n📝 {notes}"
+    return theme, activity, {
+        "title": title,
+        "sprint": sprint,
+        "team": team,
+        "status": status,
+    }
+
+
+def _add_story(acts: Dict[str, Dict], activity: str, story: Dict) -> None:
+    # trouve ou crée l'activité
+    act = acts.setdefault(activity.lower(), {"name": activity, "stories": []})
+    act["stories"].append(story)
+
+
+def _theme_entry(name: str, acts: Dict[str, Dict]) -> Dict:
+    return {"name": name, "activities": list(acts.values())}
+
+
+def load_from_csv(path: str, workers: int = 1) -> Dict:
+    """Charge tout le CSV en modèle ; `workers` > 1 répartit le parsing sur
+    plusieurs processus (utile au-delà de ~100k lignes)."""
     model: Dict[str, List] = {"release": "R4", "themes": []}
-    themes: Dict[str, Dict] = {}
+    # thème -> nom d'activité en minuscules -> activité
+    themes: Dict[str, Dict[str, Dict]] = {}
+
+    parsed = _load_csv_parallel(path, workers) if workers > 1 else None
+    if parsed is not None:
+        themes = parsed
+    else:
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                theme, activity, story = _parse_row(row)
+                _add_story(themes.setdefault(theme, {}), activity, story)
+
+    model["themes"] = [_theme_entry(t_name, acts) for t_name, acts in themes.items()]
+    return model
+
+
+def _record_end(mm: mmap.mmap, start: int, pos: int) -> int:
+    """Fin (exclue) du premier enregistrement CSV se terminant à partir de `pos`.
+
+    Un saut de ligne ne termine un enregistrement que s'il est hors guillemets,
+    c.-à-d. précédé d'un nombre pair de `"` depuis `start` (début
+    d'enregistrement) : les guillemets échappés sont doublés.
+    """
+    size = len(mm)
+    end = mm.find(b"\n", pos) + 1 or size
+    quotes = mm[start:end].count(b'"')
+    while quotes % 2 and end < size:
+        nxt = mm.find(b"\n", end) + 1 or size
+        quotes += mm[end:nxt].count(b'"')
+        end = nxt
+    return end
+
+
+def _csv_chunks(path: str, count: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """En-têtes du CSV et plages d'octets [début, fin) alignées sur des fins
+    d'enregistrement (les champs entre guillemets peuvent contenir des sauts
+    de ligne)."""
+    if os.path.getsize(path) == 0:
+        return [], []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        header_end = _record_end(mm, 0, 0)
+        fieldnames = next(csv.reader(io.StringIO(mm[:header_end].decode("utf-8"), newline='')), [])
+        step = max(1, (size - header_end) // count)
+        bounds = []
+        start = header_end
+        while start < size:
+            end = _record_end(mm, start, min(start + step, size) - 1)
+            bounds.append((start, end))
+            start = end
+    return fieldnames, bounds
+
+
+def _parse_csv_chunk(path: str, fieldnames: List[str], start: int, end: int) -> Optional[Dict[str, Dict[str, Dict]]]:
+    """Parse un morceau ; None si une ligne a moins de champs que l'en-tête
+    (découpage incohérent, p. ex. guillemet isolé dans un champ)."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode("utf-8")
+    themes: Dict[str, Dict[str, Dict]] = {}
+    for row in csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames):
+        if None in row.values():
+            return None
+        theme, activity, story = _parse_row(row)
+        _add_story(themes.setdefault(theme, {}), activity, story)
+    return themes
+
+
+def _load_csv_parallel(path: str, workers: int) -> Optional[Dict[str, Dict[str, Dict]]]:
+    """Parsing multi-processus ; None si un morceau est invalide, auquel cas
+    load_from_csv retombe sur la lecture séquentielle."""
+    fieldnames, bounds = _csv_chunks(path, workers)
+    themes: Dict[str, Dict[str, Dict]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_parse_csv_chunk, path, fieldnames, start, end) for start, end in bounds]
+        results = [fut.result() for fut in futures]
+    if any(chunk is None for chunk in results):
+        return None
+
+    # fusion dans le processus principal, dans l'ordre des morceaux pour
+    # conserver l'ordre d'apparition des thèmes / activités / stories
+    for chunk in results:
+        for theme, acts in chunk.items():
+            merged = themes.setdefault(theme, {})
+            for key, act in acts.items():
+                if key in merged:
+                    merged[key]["stories"].extend(act["stories"])
+                else:
+                    merged[key] = act
+    return themes
+
+
+def iter_themes_from_csv(path: str) -> Iterator[Dict]:
+    """Variante streaming de load_from_csv (--stream) : produit chaque thème
+    dès que le CSV passe au thème suivant.
+
+    Le CSV doit être groupé par thème : un thème déjà produit qui réapparaît
+    lève ValueError plutôt que de donner un second frame du même nom.
+    """
+    done = set()
+    current: Optional[str] = None
+    acts: Dict[str, Dict] = {}
 
     with open(path, newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
-            theme = row.get("Theme", "Inconnu").strip()
-            activity = row.get("Activity", "Général").strip()
-            story = row.get("Story", "").strip()
-            sprint = row.get("Sprint", "S1").strip()
-            team = row.get("Team", "MO").strip()
-            status = row.get("Status", "Backlog").strip()
-            notes = row.get("Notes", "").strip()
-
-            if theme not in themes:
-                themes[theme] = {"name": theme, "activities": []}
-
-            # trouve ou crée l'activité
-            acts = themes[theme]["activities"]
-            act = next((a for a in acts if a["name"].lower() == activity.lower()), None)
-            if not act:
-                act = {"name": activity, "stories": []}
-                acts.append(act)
-
-            title = story if not notes else f"{story}\n\n📝 {notes}"
-            act["stories"].append({
-                "title": title,
-                "sprint": sprint,
-                "team": team,
-                "status": status,
-            })
-
-    model["themes"] = list(themes.values())
-    return model
+            theme, activity, story = _parse_row(row)
+            if theme in done:
+                raise ValueError(
+                    f"{path}:{reader.line_num}: le thème « {theme} » réapparaît après un autre thème ; "
+                    "--stream exige un CSV groupé par thème (relancer sans --stream)"
+                )
+            if theme != current:
+                if current is not None:
+                    yield _theme_entry(current, acts)
+                    done.add(current)
+                current, acts = theme, {}
+            _add_story(acts, activity, story)
+
+    if current is not None:
+        yield _theme_entry(current, acts)
+
+
+# --- Plan de rendu (précalculé) ---
+
+DRY_RUN_TEXT_LEN = 40  # caractères de sticky affichés en --dry-run
+
+
+@dataclass(slots=True)
+class StickyPlan:
+    text: str
+    x: float
+    y: float
+    style: Dict
+
+
+@dataclass(slots=True)
+class LanePlan:
+    name: str
+    x: float
+    y: float
+    stickies: List[StickyPlan] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class FramePlan:
+    name: str
+    x: float
+    y: float
+    lanes: List[LanePlan] = field(default_factory=list)
+
+
+def _plan_theme(col_idx: int, theme: Dict, dry_run: bool = False) -> FramePlan:
+    fx, fy = compute_frame_origin(col_idx)
+    frame = FramePlan(theme.get("name", f"Theme {col_idx+1}"), fx, fy)
+
+    # abscisses communes à toutes les lanes du frame
+    title_x = fx - FRAME_W/2 + 200
+    start_x = fx - FRAME_W/2 + 300
+
+    for lane_idx, activity in enumerate(theme.get("activities", [])):
+        # Titre de la lane (shape rect)
+        lane = LanePlan(activity.get("name", f"Activité {lane_idx+1}"), title_x, lane_title_y(fy, lane_idx))
+        frame.lanes.append(lane)
+
+        # Zone de stickies pour cette lane
+        stories = activity.get("stories", [])
+        if not stories:
+            continue
+
+        # grille: 4 colonnes par défaut
+        grid_columns = 4
+        start_y = lane_y(fy, lane_idx)
+        positions = sticky_grid_positions(start_x, start_y, grid_columns, len(stories))
+
+        for (story, (sx, sy)) in zip(stories, positions.tolist()):
+            sprint = story.get("sprint", "S?")
+            team = story.get("team", "MO")
+            status = story.get("status", "Backlog")
+            style, emoji = _style_for(team, status)
+            if dry_run:
+                # le dry-run n'affiche que DRY_RUN_TEXT_LEN caractères : le titre
+                # tronqué suffit, sans la ligne équipe / sprint
+                text = f"{emoji} {story.get('title','Story')[:DRY_RUN_TEXT_LEN]}"
+            else:
+                text = f"{emoji} {story.get('title','Story')}{_suffix(team, sprint)}"
+            lane.stickies.append(StickyPlan(text, sx, sy, style))
+
+    return frame
+
+
+def _precompute(model: Dict, dry_run: bool = False) -> List[FramePlan]:
+    """Aplatit le modèle (thèmes / activités / stories) en plan de rendu :
+    positions, textes et styles sont calculés une fois, hors de la boucle HTTP."""
+    return [_plan_theme(col_idx, theme, dry_run) for col_idx, theme in enumerate(model.get("themes", []))]
 
 
 # --- Rendu du Story Map dans Miro ---
 
-def render_storymap(board_id: str, token: str, model: Dict, prefix: str = "R4", dry_run: bool = False) -> None:
-    themes = model.get("themes", [])
+async def render_storymap(board_id: str, token: str, plan: List[FramePlan], prefix: str = "R4", dry_run: bool = False) -> None:
+    if dry_run:
+        _write_lines([line for frame in plan for line in _dry_run_lines(frame, prefix)])
+        return
+
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    async with open_async_session(token) as session:
+        for frame in plan:
+            await _render_frame(board_id, session, sem, frame, prefix)
+
 
-    for col_idx, theme in enumerate(themes):
-        theme_name = theme.get("name", f"Theme {col_idx+1}")
-        frame_title = f"{prefix} – {theme_name}"
-        fx, fy = compute_frame_origin(col_idx)
+async def render_storymap_stream(board_id: str, token: str, themes: Iterator[Dict], prefix: str = "R4", dry_run: bool = False) -> None:
+    """Comme render_storymap, mais rend chaque thème pendant que la suite du
+    CSV est encore lue (producteur / consommateur sur une file bornée)."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(_produce_plans(themes, queue, dry_run))
 
         if dry_run:
-            print(f"[DRY] Frame '{frame_title}' @ ({fx},{fy})")
-        else:
-            frame_id = create_frame(board_id, token, frame_title, fx, fy)
-            print(f"Frame créé: {frame_title} -> {frame_id}")
-            time.sleep(0.2)
-
-        activities = theme.get("activities", [])
-        for lane_idx, activity in enumerate(activities):
-            act_name = activity.get("name", f"Activité {lane_idx+1}")
-            # Titre de la lane (shape rect)
-            title_x = fx - FRAME_W/2 + 200
-            title_y = lane_title_y(fy, lane_idx)
-            if dry_run:
-                print(f"[DRY] Lane '{act_name}' title @ ({title_x},{title_y})")
-            else:
-                sid = create_shape(board_id, token, f"{act_name}", title_x, title_y, 600, 60, shape="round_rectangle")
-                print(f"  Lane titre créé: {act_name} -> {sid}")
-                time.sleep(0.15)
-
-            # Zone de stickies pour cette lane
-            stories = activity.get("stories", [])
-            if not stories:
-                continue
-
-            # grille: 4 colonnes par défaut
-            grid_columns = 4
-            start_x = fx - FRAME_W/2 + 300
-            start_y = lane_y(fy, lane_idx)
-            positions = sticky_grid_positions(start_x, start_y, grid_columns, len(stories))
-
-            for (story, (sx, sy)) in zip(stories, positions):
-                sprint = story.get("sprint", "S?")
-                team = story.get("team", "MO")
-                status = story.get("status", "Backlog")
-                color = TEAM_COLOR.get(team, "light_yellow")
-                emoji = STATUS_EMOJI.get(status, "⬜️")
-                text = f"{emoji} {story.get('title','Story')}\n[{team}] [{sprint}]"
-
-                if dry_run:
-                    print(f"[DRY] Sticky '{text[:40]}...' @ ({sx},{sy}) color={color}")
-                else:
-                    sid = create_sticky(board_id, token, text, sx, sy, color)
-                    print(f"    Sticky créé: {sid} -> {text[:60]}...")
-                    time.sleep(0.12)
+            lines = []
+            while (frame := await queue.get()) is not None:
+                lines.extend(_dry_run_lines(frame, prefix))
+            _write_lines(lines)
+            return
+
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        async with open_async_session(token) as session:
+            while (frame := await queue.get()) is not None:
+                await _render_frame(board_id, session, sem, frame, prefix)
+
+
+async def _produce_plans(themes: Iterator[Dict], queue: asyncio.Queue, dry_run: bool = False) -> None:
+    # le parsing CSV est bloquant : il tourne dans un thread pour ne pas
+    # retenir les requêtes HTTP en cours
+    col_idx = 0
+    while (theme := await asyncio.to_thread(next, themes, None)) is not None:
+        await queue.put(_plan_theme(col_idx, theme, dry_run))
+        col_idx += 1
+    await queue.put(None)
+
+
+def _write_lines(lines: List[str]) -> None:
+    # une seule écriture sur stdout plutôt qu'un print par élément
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _dry_run_lines(frame: FramePlan, prefix: str) -> List[str]:
+    lines = [f"[DRY] Frame '{prefix} – {frame.name}' @ ({frame.x},{frame.y})"]
+    for lane in frame.lanes:
+        lines.append(f"[DRY] Lane '{lane.name}' title @ ({lane.x},{lane.y})")
+        for st in lane.stickies:
+            lines.append(f"[DRY] Sticky '{st.text[:DRY_RUN_TEXT_LEN]}...' @ ({st.x},{st.y}) color={st.style['fillColor']}")
+    return lines
+
+
+async def _render_frame(board_id: str, session: httpx.AsyncClient, sem: asyncio.Semaphore,
+                        frame: FramePlan, prefix: str) -> None:
+    frame_title = f"{prefix} – {frame.name}"
+
+    # Frame, lanes et stickies ne dépendent que de la position du frame, pas
+    # de son id : tout part en parallèle dans un même TaskGroup (borné par le
+    # sémaphore). Les stickies partent en bulk (BULK_MAX_ITEMS par appel).
+    stickies = [st for lane in frame.lanes for st in lane.stickies]
+    sticky_items = [{"type": "sticky_note", **_sticky_payload(st.text, st.x, st.y, st.style)} for st in stickies]
+
+    async with asyncio.TaskGroup() as tg:
+        frame_task = tg.create_task(_bounded(sem, create_frame_async, board_id, session, frame_title, frame.x, frame.y))
+        lane_tasks = [
+            tg.create_task(_bounded(sem, create_shape_async, board_id, session, lane.name, lane.x, lane.y, shape="round_rectangle"))
+            for lane in frame.lanes
+        ]
+        sticky_task = tg.create_task(create_items_bulk(board_id, session, sticky_items, sem))
+
+    print(f"Frame créé: {frame_title} -> {frame_task.result()}")
+    for lane, task in zip(frame.lanes, lane_tasks):
+        print(f"  Lane titre créé: {lane.name} -> {task.result()}")
+    for st, item_id in zip(stickies, sticky_task.result()):
+        print(f"    Sticky créé: {st.text[:60]}... -> {item_id}")
 
 
 # --- CLI ---
 
+def run_async(coro, backend: str = "asyncio"):
+    """Exécute `coro` sur la boucle d'événements choisie."""
+    if backend == "uvloop":
+        try:
+            import uvloop
+        except ImportError:
+            raise SystemExit("Veuillez installer uvloop: pip install uvloop")
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _first_error(group: BaseExceptionGroup) -> BaseException:
+    # les TaskGroup imbriqués produisent des groupes de groupes
+    exc = group
+    while isinstance(exc, BaseExceptionGroup):
+        exc = exc.exceptions[0]
+    return exc
+
+
 def parse_args():
     p = argparse.ArgumentParser(description="Publier le Story Mapping R4 (IT CALF) sur Miro")
     p.add_argument("--board", dest="board_id", default=os.getenv("MIRO_BOARD_ID"), help="ID du board Miro")
@@ -384,6 +787,14 @@ def parse_args():
     p.add_argument("--csv", dest="csv_path", default=None, help="Chemin CSV optionnel pour alimenter le story map")
     p.add_argument("--prefix", dest="prefix", default="R4", help="Préfixe pour les frames (idempotence légère)")
     p.add_argument("--dry-run", dest="dry", action="store_true", help="N'écrit pas dans Miro, affiche seulement")
+    p.add_argument("--backend", dest="backend", choices=["asyncio", "uvloop"], default="asyncio",
+                   help="Boucle d'événements pour les appels HTTP (uvloop : moins d'overhead par requête)")
+    p.add_argument("--fast", dest="fast", action="store_true",
+                   help="Compile le calcul de placement avec Numba (utile pour les très gros CSV)")
+    p.add_argument("--workers", dest="workers", type=int, default=1,
+                   help="Processus de parsing CSV (>1 pour les très gros CSV)")
+    p.add_argument("--stream", dest="stream", action="store_true",
+                   help="Rend chaque thème pendant la lecture du CSV (CSV groupé par thème requis)")
     return p.parse_args()
 
 
@@ -394,14 +805,29 @@ def main():
     if not args.token:
         raise SystemExit("Veuillez fournir --token ou définir MIRO_TOKEN")
 
-    if args.csv_path:
+    if args.stream and (not args.csv_path or args.workers > 1):
+        raise SystemExit("--stream nécessite --csv et n'est pas compatible avec --workers")
+
+    if args.fast:
+        enable_fast_geometry()
+
+    if args.stream:
+        print(f"Chargement du modèle depuis CSV (en flux): {args.csv_path}")
+        themes = iter_themes_from_csv(args.csv_path)
+        job = render_storymap_stream(args.board_id, args.token, themes, prefix=args.prefix, dry_run=args.dry)
+    elif args.csv_path:
         print(f"Chargement du modèle depuis CSV: {args.csv_path}")
-        model = load_from_csv(args.csv_path)
+        plan = _precompute(load_from_csv(args.csv_path, workers=args.workers), dry_run=args.dry)
+        job = render_storymap(args.board_id, args.token, plan, prefix=args.prefix, dry_run=args.dry)
     else:
         print("Utilisation du modèle par défaut R4 (projet IT CALF)")
-        model = DEFAULT_MODEL
+        plan = _precompute(DEFAULT_MODEL, dry_run=args.dry)
+        job = render_storymap(args.board_id, args.token, plan, prefix=args.prefix, dry_run=args.dry)
 
-    render_storymap(args.board_id, args.token, model, prefix=args.prefix, dry_run=args.dry)
+    try:
+        run_async(job, args.backend)
+    except* (RuntimeError, ValueError) as eg:
+        raise SystemExit(str(_first_error(eg)))
     print("Terminé.")
 
 